@@ -24,31 +24,72 @@ workflows. The pysmo package consists of:
   a particular topic.
 """
 
+from importlib import import_module
 from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
 
 from pysmo.types import Hypocenter, Location, Seismogram, Station, Event
 
-from pysmo.classes.mini import (
-    MiniSeismogram,
-    MiniLocation,
-    MiniStation,
-    MiniHypocenter,
-    MiniEvent,
-)
+if TYPE_CHECKING:
+    from pysmo.classes.mini import (
+        MiniSeismogram,
+        MiniLocation,
+        MiniStation,
+        MiniHypocenter,
+        MiniEvent,
+    )
 
-from pysmo.classes.sac import SAC
+    from pysmo.classes.sac import SAC
+
+    from pysmo.functions import (
+        normalize,
+        detrend,
+        resample,
+        time_array,
+        unix_time_array,
+        datetime_array,
+        plotseis,
+        azimuth,
+        backazimuth,
+        distance,
+    )
+
+# Classes and functions are only imported when first accessed (PEP 562), so
+# that using just the pysmo types does not require importing e.g. scipy and
+# matplotlib.
+_LAZY_IMPORTS = {
+    "MiniSeismogram": "pysmo.classes.mini",
+    "MiniLocation": "pysmo.classes.mini",
+    "MiniStation": "pysmo.classes.mini",
+    "MiniHypocenter": "pysmo.classes.mini",
+    "MiniEvent": "pysmo.classes.mini",
+    "SAC": "pysmo.classes.sac",
+    "normalize": "pysmo.functions",
+    "detrend": "pysmo.functions",
+    "resample": "pysmo.functions",
+    "time_array": "pysmo.functions",
+    "unix_time_array": "pysmo.functions",
+    "datetime_array": "pysmo.functions",
+    "plotseis": "pysmo.functions",
+    "azimuth": "pysmo.functions",
+    "backazimuth": "pysmo.functions",
+    "distance": "pysmo.functions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-from pysmo.functions import (
-    normalize,
-    detrend,
-    resample,
-    time_array,
-    unix_time_array,
-    plotseis,
-    azimuth,
-    backazimuth,
-    distance,
-)
 
 __version__ = version("pysmo")
 
@@ -69,6 +110,7 @@ __all__ = [
     "resample",
     "time_array",
     "unix_time_array",
+    "datetime_array",
     "plotseis",
     "azimuth",
     "backazimuth",
@@ -12,18 +12,29 @@ if sys.version_info >= (3, 11):
     from typing import Self, Any
 else:
     from typing_extensions import Self, Any
+from collections.abc import Sequence
+from typing import get_args
 from pysmo.lib.defaults import SEISMOGRAM_DEFAULTS
 from pysmo.lib.functions import lib_normalize, lib_detrend, lib_resample
+from pysmo.lib.validators import validate_latitude, validate_longitude
 from pysmo import Seismogram
 from datetime import datetime, timedelta, timezone
-from attrs import define, field, validators, Attribute
+from attrs import define, field, fields, validators, Attribute, Factory, NOTHING
 from attrs_strict import type_validator
 import numpy as np
 import numpy.typing as npt
 import copy
 
+# Default (empty) data shared by all MiniSeismogram instances. It is made read
+# only so that it can't be changed in place via one of them.
+_EMPTY_DATA = np.empty(0)
+_EMPTY_DATA.setflags(write=False)
+
 
 def datetime_is_utc(_: Any, attribute: Attribute, value: datetime) -> None:
+    # The default begin_time is known to be in UTC.
+    if value is SEISMOGRAM_DEFAULTS.begin_time:
+        return
     if value.tzinfo != timezone.utc:
         raise TypeError(f"datetime object {attribute} doesn't have tzdata=timezone.utc")
 
@@ -60,16 +71,17 @@ class MiniSeismogram:
         default=SEISMOGRAM_DEFAULTS.delta,
         validator=type_validator(),
     )
-    data: npt.NDArray = field(factory=lambda: np.array([]), validator=type_validator())
+    data: npt.NDArray = field(default=_EMPTY_DATA, validator=type_validator())
 
     def __len__(self) -> int:
-        return np.size(self.data)
+        return self.data.size
 
     @property
     def end_time(self) -> datetime:
-        if len(self) == 0:
+        npts = self.data.size
+        if npts == 0:
             return self.begin_time
-        return self.begin_time + timedelta(seconds=self.delta * (len(self) - 1))
+        return self.begin_time + timedelta(seconds=self.delta * (npts - 1))
 
     @classmethod
     def clone(cls, seismogram: Seismogram, skip_data: bool = False) -> Self:
@@ -103,12 +115,17 @@ class MiniSeismogram:
             >>> print(cloned_seis.data)
             [2302. 2313. 2345. ... 2836. 2772. 2723.]
         """
-        cloned_seismogram = cls()
-        cloned_seismogram.begin_time = copy.copy(seismogram.begin_time)
-        cloned_seismogram.delta = seismogram.delta
-        if not skip_data:
-            cloned_seismogram.data = copy.copy(seismogram.data)
-        return cloned_seismogram
+        # Passing everything to the constructor runs the validators once,
+        # instead of once for the defaults and again for each assignment.
+        if skip_data:
+            return cls(
+                begin_time=copy.copy(seismogram.begin_time), delta=seismogram.delta
+            )
+        return cls(
+            begin_time=copy.copy(seismogram.begin_time),
+            delta=seismogram.delta,
+            data=seismogram.data.copy(),
+        )
 
     def normalize(self) -> None:
         """Normalize the seismogram data with its absolute max value.
@@ -176,12 +193,120 @@ class MiniLocation:
     """
 
     latitude: float | int = field(
-        validator=[validators.ge(-90), validators.le(90), type_validator()],
+        validator=[validate_latitude, type_validator()],
     )
     longitude: float | int = field(
-        validator=[validators.gt(-180), validators.le(180), type_validator()],
+        validator=[validate_longitude, type_validator()],
     )
 
+    @classmethod
+    def from_arrays(cls, **arrays: Sequence[Any] | npt.NDArray) -> list[Self]:
+        """Create multiple instances at once from arrays of attribute values.
+
+        When many instances are created (e.g. when reading a catalogue) this
+        is faster than creating them one at a time, as numeric arrays are
+        validated once as a whole rather than for each individual instance.
+
+        Parameters:
+            arrays: Array (or sequence) of values for each attribute. All
+                arrays must be of the same length, and arrays for attributes
+                with default values may be omitted.
+
+        Returns:
+            List of new instances.
+
+        Examples:
+            >>> import numpy as np
+            >>> from pysmo import MiniLocation
+            >>> locations = MiniLocation.from_arrays(
+            ...     latitude=np.array([41.8781, -33.8688]),
+            ...     longitude=np.array([-87.6298, 151.2093]),
+            ... )
+            >>> locations[1]
+            MiniLocation(latitude=-33.8688, longitude=151.2093)
+        """
+        columns: dict[str, list] = {}
+        for attribute in fields(cls):
+            if attribute.name not in arrays:
+                if attribute.default is NOTHING:
+                    raise TypeError(
+                        f"{cls.__name__}.from_arrays() missing array for "
+                        f"attribute '{attribute.name}'."
+                    )
+                continue
+            values = arrays.pop(attribute.name)
+            if (
+                isinstance(values, np.ndarray)
+                and values.ndim == 1
+                and values.size > 0
+                and values.dtype.kind in "iuf"
+                and float in (get_args(attribute.type) or (attribute.type,))
+                and np.isfinite(values).all()
+            ):
+                # Validators of numeric attributes are type and range checks,
+                # so for finite values it suffices to validate the extreme
+                # values of the array. Arrays containing NaN or inf, and other
+                # sequences (whose items may be of different types), are
+                # validated value by value below, like individual instances.
+                column = values.tolist()
+                extremes = [values.min().item(), values.max().item()]
+            else:
+                column = list(values)
+                extremes = column
+            if attribute.validator is not None:
+                for value in extremes:
+                    attribute.validator(None, attribute, value)
+            columns[attribute.name] = column
+
+        if arrays:
+            raise TypeError(
+                f"{cls.__name__}.from_arrays() got arrays for unknown attributes "
+                f"{', '.join(repr(name) for name in arrays)}."
+            )
+        if len({len(column) for column in columns.values()}) > 1:
+            raise ValueError("Input arrays must be of equal length.")
+
+        names = tuple(columns)
+        return [
+            cls._unchecked(**dict(zip(names, values)))
+            for values in zip(*columns.values())
+        ]
+
+    @classmethod
+    def _unchecked(cls, **kwargs: Any) -> Self:
+        """Create an instance without running any validators.
+
+        For trusted bulk construction only (e.g. after validating all values
+        at once as in [`from_arrays`][pysmo.MiniLocation.from_arrays]).
+        Attributes that are not given are set to their default value.
+
+        Parameters:
+            kwargs: Attribute values.
+
+        Returns:
+            New instance.
+        """
+        instance = cls.__new__(cls)
+        for attribute in fields(cls):
+            if attribute.name in kwargs:
+                value = kwargs[attribute.name]
+            elif isinstance(attribute.default, Factory):  # type: ignore[arg-type]
+                factory = attribute.default
+                value = (
+                    factory.factory(instance)
+                    if factory.takes_self
+                    else factory.factory()
+                )
+            elif attribute.default is not NOTHING:
+                value = attribute.default
+            else:
+                raise TypeError(
+                    f"{cls.__name__}._unchecked() missing value for "
+                    f"attribute '{attribute.name}'."
+                )
+            object.__setattr__(instance, attribute.name, value)
+        return instance
+
 
 @define(kw_only=True)
 class MiniStation(MiniLocation):
@@ -1,17 +1,16 @@
 import sys
 
 if sys.version_info >= (3, 11):
-    from typing import Literal, get_args, overload, Self
+    from typing import Literal, cast, get_args, overload, Self
 else:
-    from typing import Literal, get_args, overload
+    from typing import Literal, cast, get_args, overload
     from typing_extensions import Self
 from pysmo.lib.io import SacIO
 from pysmo.lib.defaults import SEISMOGRAM_DEFAULTS
 from pysmo.lib.exceptions import SacHeaderUndefined
 from pysmo.lib.decorators import value_not_none
 from attrs import define, field
-from datetime import datetime, timedelta, time, date, timezone
-import numpy as np
+from datetime import datetime, timedelta, timezone
 import numpy.typing as npt
 
 TSacTimeHeaders = Literal[
@@ -29,6 +28,9 @@ class _SacNested:
     """
 
     _parent: SacIO = field(repr=False)
+    _ref_datetime_cache: tuple[tuple, datetime] | None = field(
+        default=None, init=False, repr=False, eq=False
+    )
 
     @property
     def _ref_datetime(self) -> datetime:
@@ -41,11 +43,28 @@ class _SacNested:
         # to define the reference time in case it is missing in
         # the parent SacIO object.
         # TODO: maybe it needs setting in the SacIO object too?
-        if self._parent.kztime is None or self._parent.kzdate is None:
-            return SEISMOGRAM_DEFAULTS.begin_time - timedelta(seconds=self._parent.b)
-        ref_time = time.fromisoformat(self._parent.kztime)
-        ref_date = date.fromisoformat(self._parent.kzdate)
-        return datetime.combine(date=ref_date, time=ref_time, tzinfo=timezone.utc)
+        parent = self._parent
+        key = (
+            parent.nzyear,
+            parent.nzjday,
+            parent.nzhour,
+            parent.nzmin,
+            parent.nzsec,
+            parent.nzmsec,
+        )
+        if None in key:  # i.e. kzdate or kztime is None
+            return SEISMOGRAM_DEFAULTS.begin_time - timedelta(seconds=parent.b)
+        # Otherwise the reference time is cached, keyed on the SAC headers it
+        # is derived from (they may be changed directly in the parent SacIO).
+        if self._ref_datetime_cache is not None and self._ref_datetime_cache[0] == key:
+            return self._ref_datetime_cache[1]
+        # Same as combining kzdate and kztime, without their string round trip.
+        nzyear, nzjday, nzhour, nzmin, nzsec, nzmsec = cast(tuple[int, ...], key)
+        ref_datetime = datetime(
+            nzyear, 1, 1, nzhour, nzmin, nzsec, nzmsec * 1000, tzinfo=timezone.utc
+        ) + timedelta(days=nzjday - 1)
+        self._ref_datetime_cache = (key, ref_datetime)
+        return ref_datetime
 
     def _get_datetime_from_sac(
         self, sac_time_header: TSacTimeHeaders
@@ -102,8 +121,12 @@ class SacSeismogram(_SacNested):
         >>>
     """
 
+    _end_time_cache: tuple[tuple, datetime] | None = field(
+        default=None, init=False, repr=False, eq=False
+    )
+
     def __len__(self) -> int:
-        return np.size(self.data)
+        return self._parent.data.size
 
     @property
     def data(self) -> npt.NDArray:
@@ -135,9 +158,29 @@ class SacSeismogram(_SacNested):
 
     @property
     def end_time(self) -> datetime:
-        if len(self) == 0:
-            return self.begin_time
-        return self.begin_time + timedelta(seconds=self.delta * (len(self) - 1))
+        # The SAC headers may be changed directly in the parent SacIO object,
+        # so the cached end_time is keyed on the headers it is computed from.
+        parent = self._parent
+        npts = parent.data.size
+        key = (
+            parent.nzyear,
+            parent.nzjday,
+            parent.nzhour,
+            parent.nzmin,
+            parent.nzsec,
+            parent.nzmsec,
+            parent.b,
+            parent.delta,
+            npts,
+        )
+        if self._end_time_cache is not None and self._end_time_cache[0] == key:
+            return self._end_time_cache[1]
+        if npts == 0:
+            end_time = self.begin_time
+        else:
+            end_time = self.begin_time + timedelta(seconds=parent.delta * (npts - 1))
+        self._end_time_cache = (key, end_time)
+        return end_time
 
 
 @define(kw_only=True)
@@ -169,9 +212,10 @@ class SacStation(_SacNested):
 
     @property
     def name(self) -> str:
-        if self._parent.kstnm is None:
+        kstnm = self._parent.kstnm
+        if kstnm is None:
             raise SacHeaderUndefined(header="kstnm")
-        return self._parent.kstnm
+        return kstnm
 
     @name.setter
     @value_not_none
@@ -188,9 +232,10 @@ class SacStation(_SacNested):
 
     @property
     def latitude(self) -> float:
-        if self._parent.stla is None:
+        stla = self._parent.stla
+        if stla is None:
             raise SacHeaderUndefined(header="stla")
-        return self._parent.stla
+        return stla
 
     @latitude.setter
     @value_not_none
@@ -199,9 +244,10 @@ class SacStation(_SacNested):
 
     @property
     def longitude(self) -> float:
-        if self._parent.stlo is None:
+        stlo = self._parent.stlo
+        if stlo is None:
             raise SacHeaderUndefined(header="stlo")
-        return self._parent.stlo
+        return stlo
 
     @longitude.setter
     @value_not_none
@@ -248,9 +294,10 @@ class SacEvent(_SacNested):
 
     @property
     def latitude(self) -> float:
-        if self._parent.evla is None:
+        evla = self._parent.evla
+        if evla is None:
             raise SacHeaderUndefined(header="evla")
-        return self._parent.evla
+        return evla
 
     @latitude.setter
     @value_not_none
@@ -259,9 +306,10 @@ class SacEvent(_SacNested):
 
     @property
     def longitude(self) -> float:
-        if self._parent.evlo is None:
+        evlo = self._parent.evlo
+        if evlo is None:
             raise SacHeaderUndefined(header="evlo")
-        return self._parent.evlo
+        return evlo
 
     @longitude.setter
     @value_not_none
@@ -270,9 +318,10 @@ class SacEvent(_SacNested):
 
     @property
     def depth(self) -> float:
-        if self._parent.evdp is None:
+        evdp = self._parent.evdp
+        if evdp is None:
             raise SacHeaderUndefined(header="evdp")
-        return self._parent.evdp * 1000
+        return evdp * 1000
 
     @depth.setter
     @value_not_none
@@ -382,6 +431,10 @@ class SacTimestamps(_SacNested):
         ```
     """
 
+    # Not an attrs class (the annotations below would become fields), so
+    # slots are declared explicitly to avoid an instance __dict__.
+    __slots__ = ()
+
     b: SacTimeConverter = SacTimeConverter()
     e: SacTimeConverter = SacTimeConverter(readonly=True)
     o: SacTimeConverter = SacTimeConverter()
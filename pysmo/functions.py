@@ -10,6 +10,11 @@ import matplotlib.dates as mdates
 import matplotlib.figure
 import numpy as np
 import numpy.typing as npt
+from functools import lru_cache
+from typing import Any
+from datetime import datetime, timedelta, timezone
+
+_UNIX_EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
 
 
 def normalize(seismogram: Seismogram) -> MiniSeismogram:
@@ -161,9 +166,7 @@ def time_array(seismogram: Seismogram) -> npt.NDArray:
         12843.307664583335 2377.0
         ...
     """
-    start = mdates.date2num(seismogram.begin_time)
-    end = mdates.date2num(seismogram.end_time)
-    return np.linspace(start, end, len(seismogram))
+    return unix_time_array(seismogram) / 86400 + _mpl_epoch_offset(mdates.get_epoch())
 
 
 def unix_time_array(seismogram: Seismogram) -> npt.NDArray:
@@ -190,9 +193,49 @@ def unix_time_array(seismogram: Seismogram) -> npt.NDArray:
         1109661782.22 2377.0
         ...
     """
+    npts = len(seismogram)
     start = seismogram.begin_time.timestamp()
-    end = seismogram.end_time.timestamp()
-    return np.linspace(start, end, len(seismogram))
+    step = (seismogram.end_time.timestamp() - start) / max(npts - 1, 1)
+    return start + np.arange(npts) * step
+
+
+def datetime_array(seismogram: Seismogram) -> npt.NDArray:
+    """Create an array containing NumPy datetime64 objects of each point in the
+    Seismogram data.
+
+    The times are calculated in one vectorised operation and rounded to
+    microseconds, the same resolution as the `begin_time` of a seismogram.
+
+    Parameters:
+        seismogram: Seismogram object.
+
+    Returns:
+        Array containing the times (as `datetime64[us]` in UTC) of seismogram data.
+
+    Examples:
+        >>> from pysmo import SAC, datetime_array
+        >>> my_seis = SAC.from_file('testfile.sac').seismogram
+        >>> seis_data = my_seis.data
+        >>> seis_times = datetime_array(my_seis)
+        >>> for t, v in zip(seis_times, seis_data):
+        ...     print(t,v)
+        ...
+        2005-03-01T07:23:02.160000 2302.0
+        2005-03-01T07:23:02.180000 2313.0
+        2005-03-01T07:23:02.200000 2345.0
+        2005-03-01T07:23:02.220000 2377.0
+        ...
+    """
+    begin_us = (seismogram.begin_time - _UNIX_EPOCH) // timedelta(microseconds=1)
+    offsets_us = np.rint(np.arange(len(seismogram)) * (seismogram.delta * 1e6))
+    return np.datetime64(begin_us, "us") + offsets_us.astype("timedelta64[us]")
+
+
+@lru_cache
+def _mpl_epoch_offset(epoch: str) -> float:
+    """Number of days between the Matplotlib epoch and the unix epoch."""
+    offset = np.datetime64("1970-01-01T00:00:00", "us") - np.datetime64(epoch, "us")
+    return offset / np.timedelta64(1, "D")
 
 
 def plotseis(
@@ -200,7 +243,7 @@ def plotseis(
     outfile: str = "",
     showfig: bool = True,
     title: str = "",
-    **kwargs: dict,
+    **kwargs: Any,
 ) -> matplotlib.figure.Figure:
     """Plot Seismogram objects.
 
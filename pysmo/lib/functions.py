@@ -6,14 +6,21 @@ Reasons for putting functions here:
       classes within methods at the same time
 """
 
+from functools import lru_cache
 from pyproj import Geod
 from pysmo.lib.defaults import DEFAULT_ELLPS
 from pysmo import Seismogram
 import numpy as np
 import numpy.typing as npt
-import scipy.signal
 
 
+@lru_cache
+def _geod(ellps: str) -> Geod:
+    """Return a (shared) Geod instance for an ellipsoid."""
+    return Geod(ellps=ellps)
+
+
+@lru_cache(maxsize=8192)
 def lib_azdist(
     lat1: float, lon1: float, lat2: float, lon2: float, ellps: str = DEFAULT_ELLPS
 ) -> tuple[float, float, float]:
@@ -30,9 +37,13 @@ def lib_azdist(
         az: Azimuth
         baz: Backazimuth
         dist: Distance between the points in metres.
+
+    Note:
+        Results are cached, so that repeated calculations for the same pair
+        of points (e.g. a fixed set of stations and many events) are only
+        computed once.
     """
-    g = Geod(ellps=ellps)
-    az, baz, dist = g.inv(lons1=lon1, lats1=lat1, lons2=lon2, lats2=lat2)
+    az, baz, dist = _geod(ellps).inv(lons1=lon1, lats1=lat1, lons2=lon2, lats2=lat2)
 
     # Prefer positive bearings
     if az < 0:
@@ -51,20 +62,75 @@ def lib_normalize(seismogram: Seismogram) -> npt.NDArray:
     Returns:
         Normalised data.
     """
-    norm = np.max(np.abs(seismogram.data))
-    return seismogram.data / norm
+    data = seismogram.data
+    # Avoids creating a temporary array with the absolute values of the data.
+    if np.issubdtype(data.dtype, np.inexact):
+        norm = np.maximum(data.max(), -data.min())
+    else:
+        # Negating (or taking the absolute value of) integers can overflow,
+        # so the extremes are compared as Python integers instead.
+        norm = max(int(data.max()), -int(data.min()))
+    return data / norm
 
 
 def lib_detrend(seismogram: Seismogram) -> npt.NDArray:
-    """Normalize the seismogram with its absolute max value
+    """Remove the linear least-squares trend from a seismogram.
 
     Parameters:
         seismogram: Seismogram object.
 
     Returns:
-        Normalised data.
+        Detrended data.
+
+    Note:
+        The least-squares fit is calculated from closed-form sums over sample
+        indices centred on the middle of the data, which gives the same result
+        as `scipy.signal.detrend` without building a design matrix and copying
+        the data multiple times.
     """
-    return scipy.signal.detrend(seismogram.data)
+    data = seismogram.data
+    dtype = data.dtype if np.issubdtype(data.dtype, np.inexact) else np.float64
+    npts = len(data)
+    if npts == 0:
+        return np.array(data, dtype=dtype)
+
+    x = np.arange(npts, dtype=dtype)
+    x -= (npts - 1) / 2
+    # sum(x**2) for centred indices is npts*(npts**2-1)/12
+    slope = np.dot(x, data) / (npts * (npts**2 - 1) / 12) if npts > 1 else 0
+    detrended = np.subtract(data, np.mean(data), dtype=dtype)
+    x *= slope
+    detrended -= x
+    return detrended
+
+
+def _fourier_resample(data: npt.NDArray, num: int) -> npt.NDArray:
+    """Resample data to `num` samples using the Fourier method.
+
+    This is the same algorithm as [`scipy.signal.resample`][scipy.signal.resample]
+    (without windowing), using real FFTs directly so that the spectrum is
+    modified in place and `float32` data are not converted to `float64`.
+    """
+    import scipy.fft
+
+    npts = len(data)
+    m = min(num, npts)
+    spectrum = scipy.fft.rfft(data)[: m // 2 + 1]
+    # Account for the unpaired bin at the Nyquist frequency
+    if m % 2 == 0 and num != npts:
+        spectrum[m // 2] *= 2 if num < npts else 0.5
+    spectrum /= npts / num
+    return scipy.fft.irfft(spectrum, n=num, overwrite_x=True)
+
+
+def _has_large_prime_factor(n: int, limit: int = 500) -> bool:
+    """Check if an integer has a prime factor larger than `limit`."""
+    for p in range(2, limit + 1):
+        if p * p > n:
+            break
+        while n % p == 0:
+            n //= p
+    return n > limit
 
 
 def lib_resample(seismogram: Seismogram, delta: float) -> npt.NDArray:
@@ -80,7 +146,23 @@ def lib_resample(seismogram: Seismogram, delta: float) -> npt.NDArray:
     Warning:
         interval attribute still needs to be set!
     """
+    import scipy.fft
+
     len_in = len(seismogram)
     delta_in = seismogram.delta
+    if delta == delta_in:
+        return seismogram.data.copy()
     len_out = int(len_in * delta_in / delta)
-    return scipy.signal.resample(seismogram.data, len_out)
+
+    # FFTs are much slower (up to ~10x for prime factors above 500) for lengths
+    # with large prime factors. In that case the data are padded (with the edge
+    # values to avoid a step at the end) to a length that can be transformed
+    # efficiently, and the excess samples are removed again after resampling.
+    # Other lengths are not padded, as that would change the results without
+    # making resampling noticeably faster.
+    if not _has_large_prime_factor(len_in):
+        return _fourier_resample(seismogram.data, len_out)
+    len_fast = scipy.fft.next_fast_len(len_in, real=True)
+    data = np.pad(seismogram.data, (0, len_fast - len_in), mode="edge")
+    len_out_fast = round(len_fast * delta_in / delta)
+    return _fourier_resample(data, len_out_fast)[:len_out]
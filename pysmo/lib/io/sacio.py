@@ -6,6 +6,7 @@ from __future__ import annotations
 from pysmo.lib.exceptions import SacHeaderUndefined
 from pysmo.lib.functions import lib_azdist
 from pysmo.lib.defaults import SACIO_DEFAULTS
+from pysmo.lib.validators import validate_latitude, validate_longitude
 import sys
 
 if sys.version_info >= (3, 11):
@@ -19,6 +20,8 @@ from enum import Enum
 import struct
 import datetime
 import io
+import mmap
+import os
 import requests
 import urllib.parse
 import zipfile
@@ -344,6 +347,19 @@ SAC_FOOTERS = dict(
     sdelta=Footer(start=168),
 )
 
+# Minimum size (in bytes) of SAC files that are memory mapped when reading.
+_MMAP_MIN_SIZE = 2**20
+
+# Compiled struct objects for all header and footer formats, for reading
+# little ("<") and big (">") endian files, and for writing ("", i.e. native).
+_STRUCTS = {
+    byteorder: {
+        format: struct.Struct(byteorder + format)
+        for format in {h.format for h in SAC_HEADERS.values()} | {"d"}
+    }
+    for byteorder in ("<", ">", "")
+}
+
 
 def validate_sacenum(instance: SacIO, attribute: Attribute, value: Any) -> None:
     if not hasattr(SAC_ENUMS_DICT[attribute.name], value):
@@ -778,16 +794,12 @@ class SacIO:
     stla: float | None = field(
         default=None,
         converter=converters.optional(float),
-        validator=validators.optional(
-            [type_validator(), validators.ge(-90), validators.le(90)]
-        ),
+        validator=validators.optional([type_validator(), validate_latitude]),
     )
     stlo: float | None = field(
         default=None,
         converter=converters.optional(float),
-        validator=validators.optional(
-            [type_validator(), validators.gt(-180), validators.le(180)]
-        ),
+        validator=validators.optional([type_validator(), validate_longitude]),
     )
     stel: float | None = field(
         default=None,
@@ -802,16 +814,12 @@ class SacIO:
     evla: float | None = field(
         default=None,
         converter=converters.optional(float),
-        validator=validators.optional(
-            [type_validator(), validators.ge(-90), validators.le(90)]
-        ),
+        validator=validators.optional([type_validator(), validate_latitude]),
     )
     evlo: float | None = field(
         default=None,
         converter=converters.optional(float),
-        validator=validators.optional(
-            [type_validator(), validators.gt(-180), validators.le(180)]
-        ),
+        validator=validators.optional([type_validator(), validate_longitude]),
     )
     evel: float | None = field(
         default=None,
@@ -1194,9 +1202,16 @@ class SacIO:
         """
 
         with open(filename, "rb") as file_handle:
-            self.read_buffer(file_handle.read())
-
-    def read_buffer(self, buffer: bytes) -> None:
+            # Large files are memory mapped rather than read into memory, so
+            # that the data are only copied once (when they are converted to an
+            # array). For small files mapping them is slower than reading them.
+            if os.fstat(file_handle.fileno()).st_size < _MMAP_MIN_SIZE:
+                self.read_buffer(file_handle.read())
+                return
+            with mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                self.read_buffer(buffer)
+
+    def read_buffer(self, buffer: bytes | mmap.mmap) -> None:
         """Read data and headers from a SAC byte buffer into an existing SAC instance.
 
         Parameters:
@@ -1209,11 +1224,12 @@ class SacIO:
         # Guess the file endianness first using the unused12 header field.
         # It is located at position 276 and its value should be -12345.0.
         # Try reading with little endianness
-        if struct.unpack("<f", buffer[276:280])[-1] == -12345.0:
+        if _STRUCTS["<"]["f"].unpack_from(buffer, 276)[0] == -12345.0:
             file_byteorder = "<"
         # otherwise assume big endianness.
         else:
             file_byteorder = ">"
+        structs = _STRUCTS[file_byteorder]
 
         # Loop over all header fields and store them in the SAC object under their
         # respective private names.
@@ -1227,8 +1243,7 @@ class SacIO:
             end = start + length
             if end >= len(buffer):
                 continue
-            content = buffer[start:end]
-            value = struct.unpack(file_byteorder + header_metadata.format, content)[0]
+            value = structs[header_metadata.format].unpack_from(buffer, start)[0]
             if isinstance(value, bytes):
                 # strip spaces and "\x00" chars
                 value = value.decode().rstrip(" \x00")
@@ -1274,12 +1289,14 @@ class SacIO:
         self.data = np.array([])
         if length > 0:
             data_end = start + length
-            data_format = file_byteorder + str(npts) + "f"
             if data_end > len(buffer):
                 raise EOFError()
-            content = buffer[start:data_end]
-            data = struct.unpack(data_format, content)
-            self.data = np.array(data)
+            # the data are parsed directly from the buffer and converted to
+            # (native byte order) 64 bit floats in one step. No reference to
+            # the buffer is kept, so that a memory mapped file can be closed.
+            self.data = np.frombuffer(
+                buffer, dtype=file_byteorder + "f4", count=npts, offset=start
+            ).astype(np.float64)
 
         if self.nvhdr == 7:
             for footer, footer_metadata in SAC_FOOTERS.items():
@@ -1290,9 +1307,8 @@ class SacIO:
 
                 if end > len(buffer):
                     raise EOFError()
-                content = buffer[start:end]
 
-                value = struct.unpack(file_byteorder + "d", content)[0]
+                value = structs["d"].unpack_from(buffer, start)[0]
 
                 # skip if undefined (value == -12345...)
                 if value == undefined:
@@ -1419,7 +1435,7 @@ class SacIO:
 
                 # write to file
                 file_handle.seek(start)
-                file_handle.write(struct.pack(header_format, value))
+                file_handle.write(_STRUCTS[""][header_format].pack(value))
 
             # write data (if npts > 0)
             data_1_start = 632
@@ -1427,13 +1443,15 @@ class SacIO:
             file_handle.truncate(data_1_start)
             if self.npts > 0:
                 file_handle.seek(data_1_start)
-                for x in self.data:
-                    file_handle.write(struct.pack("f", x))
+                # write all samples at once as (native byte order) 32 bit floats
+                file_handle.write(np.asarray(self.data, dtype=np.float32).tobytes())
 
             if self.nvhdr == 7:
-                for footer, footer_metadata in SAC_FOOTERS.items():
+                # the footers are stored consecutively directly after the data,
+                # so they are collected first and then written in one go.
+                footer_values = []
+                for footer in SAC_FOOTERS:
                     undefined = -12345.0
-                    start = footer_metadata.start + data_1_end
                     value = None
                     try:
                         if hasattr(self, footer):
@@ -1445,6 +1463,8 @@ class SacIO:
                     if value is None:
                         value = undefined
 
-                    # write to file
-                    file_handle.seek(start)
-                    file_handle.write(struct.pack("d", value))
+                    footer_values.append(value)
+
+                # write to file
+                file_handle.seek(data_1_end)
+                file_handle.write(np.asarray(footer_values, dtype=np.float64).tobytes())
@@ -0,0 +1,22 @@
+"""
+Validators for attrs classes that are used in multiple places in pysmo.
+
+Each validator performs a single range check, rather than chaining e.g.
+`validators.ge` and `validators.le`, which would call multiple validators
+for every attribute of every instance created.
+"""
+
+from typing import Any
+from attrs import Attribute
+
+
+def validate_latitude(_: Any, attribute: Attribute, value: float) -> None:
+    """Validate that a value is a latitude in the range [-90, 90]."""
+    if not -90 <= value <= 90:
+        raise ValueError(f"'{attribute.name}' must be in [-90, 90]: {value!r}")
+
+
+def validate_longitude(_: Any, attribute: Attribute, value: float) -> None:
+    """Validate that a value is a longitude in the range (-180, 180]."""
+    if not -180 < value <= 180:
+        raise ValueError(f"'{attribute.name}' must be in (-180, 180]: {value!r}")
@@ -25,7 +25,6 @@ import numpy as np
 import numpy.typing as npt
 from datetime import datetime
 from dataclasses import dataclass, field
-from scipy.integrate import cumulative_trapezoid
 from pysmo import MiniSeismogram
 from pysmo.lib.defaults import SEISMOGRAM_DEFAULTS
 
@@ -227,6 +226,8 @@ def generate_noise(
     start = int((NPTS - npts) / 2)
     end = start + npts
     if return_velocity:
+        from scipy.integrate import cumulative_trapezoid
+
         velocity = cumulative_trapezoid(acceleration, dx=delta)
         velocity = velocity[start:end]
         return MiniSeismogram(begin_time=begin_time, delta=delta, data=velocity)
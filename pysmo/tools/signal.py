@@ -1,8 +1,7 @@
+from collections.abc import Sequence
 from datetime import timedelta
 import numpy as np
 import numpy.typing as npt
-from scipy.signal import correlate as _correlate
-from scipy.stats import pearsonr as _pearsonr
 from pysmo import Seismogram, MiniSeismogram
 
 
@@ -56,19 +55,79 @@ def gauss(seismogram: Seismogram, Tn: float, alpha: float) -> Seismogram:
     return clone
 
 
+def envelope_multi(
+    seismogram: Seismogram, Tns: Sequence[float], alpha: float
+) -> list[MiniSeismogram]:
+    """
+    Calculates the envelopes of a seismogram for multiple gaussian filters.
+
+    This is equivalent to calling [`envelope`][pysmo.tools.signal.envelope] for
+    each center period in `Tns`, but the spectrum of the seismogram is only
+    calculated once.
+
+    Parameters:
+        seismogram: Name of the seismogram object passed to this function.
+        Tns: Center periods of the Gaussian filters [in seconds]
+        alpha: Set alpha (which determines filterwidth)
+
+    Returns:
+        List of seismograms containing the envelopes (in the same order as `Tns`).
+
+    Examples:
+        >>> from pysmo import SAC
+        >>> from pysmo.tools.signal import envelope_multi
+        >>> seis = SAC.from_file('sacfile.sac').seismogram
+        >>> Tns = [20, 50, 100] # Center Gaussian filters at 20, 50 and 100s period
+        >>> alpha = 50 # Set alpha (which determines filterwidth) to 50
+        >>> envelope_seismograms = envelope_multi(seis, Tns, alpha)
+    """
+    spec, W = _gauss_spectrum(seismogram)
+    envelopes = []
+    for Tn in Tns:
+        clone = MiniSeismogram.clone(seismogram, skip_data=True)
+        clone.data = _gauss_filter(spec, W, Tn, alpha)[0]
+        envelopes.append(clone)
+    return envelopes
+
+
 def _gauss(
     seis: Seismogram, Tn: float, alpha: float
 ) -> tuple[npt.NDArray, npt.NDArray]:
-    Wn = 1 / float(Tn)
+    spec, W = _gauss_spectrum(seis)
+    return _gauss_filter(spec, W, Tn, alpha)
+
+
+def _gauss_spectrum(seis: Seismogram) -> tuple[npt.NDArray, npt.NDArray]:
+    import scipy.fft
+
+    data = seis.data
+    npts = len(data)
     Nyq = 0.5 / seis.delta
-    npts = len(seis)
-    spec = np.fft.fft(seis.data)
-    W = np.array(np.linspace(0, Nyq, npts))
-    Hn = spec * np.exp(-1 * alpha * ((W - Wn) / Wn) ** 2)
-    Qn = complex(0, 1) * Hn.real - Hn.imag
-    hn = np.fft.ifft(Hn).real
-    qn = np.fft.ifft(Qn).real
-    an = np.sqrt(hn**2 + qn**2)  # envelope
+    # scipy.fft preserves single precision, so float32 data is also
+    # filtered in single precision.
+    spec = scipy.fft.fft(data)
+    W = np.arange(npts, dtype=spec.real.dtype) * (Nyq / max(npts - 1, 1))
+    return (spec, W)
+
+
+def _gauss_filter(
+    spec: npt.NDArray, W: npt.NDArray, Tn: float, alpha: float
+) -> tuple[npt.NDArray, npt.NDArray]:
+    import scipy.fft
+
+    # Gaussian weights exp(-alpha * ((W - Wn) / Wn) ** 2) with Wn = 1 / Tn,
+    # computed in a single buffer to avoid a temporary array per operation.
+    weights = W * Tn
+    weights -= 1
+    np.square(weights, out=weights)
+    weights *= -alpha
+    np.exp(weights, out=weights)
+    Hn = spec * weights
+    # The quadrature spectrum is i * Hn, so the quadrature trace is simply
+    # -ifft(Hn).imag and a single ifft yields both traces.
+    analytic = scipy.fft.ifft(Hn, overwrite_x=True)
+    hn = analytic.real
+    an = np.abs(analytic)  # envelope
     return (an, hn)
 
 
@@ -158,15 +217,19 @@ def delay(
             )
         mode = "valid"
         max_lag_in_samples = int(max_delay.total_seconds() / delta + 0.5)
-        zeros_to_add = np.zeros(max_lag_in_samples)
-        in1 = np.append(zeros_to_add, in1)
-        in1 = np.append(in1, zeros_to_add)
+        padded = np.zeros(len(in1) + 2 * max_lag_in_samples)
+        padded[max_lag_in_samples : max_lag_in_samples + len(in1)] = in1
+        in1 = padded
+
+    from scipy.signal import correlate
 
-    corr = _correlate(in1, in2, mode=mode)
+    corr = correlate(in1, in2, mode=mode)
     corr_index = np.argmax(corr)
 
-    if allow_negative and np.max(corr) < -np.min(corr):
-        corr_index = np.argmin(corr)
+    if allow_negative:
+        corr_index_min = np.argmin(corr)
+        if corr[corr_index] < -corr[corr_index_min]:
+            corr_index = corr_index_min
 
     if max_delay is not None:
         shift = -int(corr_index - max_lag_in_samples)
@@ -185,6 +248,9 @@ def delay(
     else:
         in2 = in2[: len(in1)]
 
-    covr, _ = _pearsonr(in1, in2)
+    # Pearson correlation coefficient of the overlapping parts
+    in1 = in1 - np.mean(in1)
+    in2 = in2 - np.mean(in2)
+    covr = np.dot(in1, in2) / np.sqrt(np.dot(in1, in1) * np.dot(in2, in2))
 
     return delay, float(covr)
@@ -1,10 +1,98 @@
-from typing import Protocol, runtime_checkable
-import numpy.typing as npt
+from __future__ import annotations
+from typing import (
+    Any,
+    Protocol,
+    TypeVar,
+    runtime_checkable,
+    _ProtocolMeta,
+)
+from types import MemberDescriptorType
+from weakref import WeakKeyDictionary
 import datetime
+import typing
+import numpy.typing as npt
+
+_T = TypeVar("_T")
+
+# Results of isinstance checks against pysmo types, keyed on the class of the
+# checked instance and then the protocol. Weak references to the former ensure
+# classes are not kept alive by the cache. Instead of True, the names of slots
+# that must also be set on the instance are stored if there are any.
+_INSTANCECHECK_CACHE: WeakKeyDictionary[type, dict[type, bool | tuple[str, ...]]] = (
+    WeakKeyDictionary()
+)
+
+# Names of the members of each protocol using the metaclass below, collected
+# once when the protocol is created.
+_PROTOCOL_ATTRS: dict[type, frozenset[str]] = {}
+
+
+def _protocol_attrs(protocol: type) -> set[str]:
+    """Returns the names of the members of a protocol class."""
+    if hasattr(protocol, "__protocol_attrs__"):
+        return set(protocol.__protocol_attrs__)
+    return set(typing._get_protocol_attrs(protocol))  # type: ignore[attr-defined]
+
+
+class _PysmoProtocolMeta(_ProtocolMeta):
+    """Metaclass for pysmo types that caches `isinstance` results.
+
+    A runtime checkable protocol checks for the presence of every member each
+    time `isinstance` is called. If all members are defined on the class of the
+    checked instance (e.g. as properties), the outcome is the same for
+    every instance of that class. This is checked directly by looking up only
+    the protocol members on that class, and the result is cached. Slots are the
+    exception, as they may be unset on a given instance: only their names are
+    cached, and they are looked up on every checked instance. All other
+    cases are handed over to the generic `typing` machinery. The outcome of
+    those is also cached if instances of the class can't have attributes of
+    their own (i.e. have no `__dict__` or `__getattr__`), which also makes
+    negative results for e.g. the pysmo Mini classes a single lookup.
+    """
+
+    def __init__(cls, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        if getattr(cls, "_is_protocol", False):
+            _PROTOCOL_ATTRS[cls] = frozenset(_protocol_attrs(cls))
+
+    def __instancecheck__(cls, instance: object) -> bool:
+        instance_type = type(instance)
+        results = _INSTANCECHECK_CACHE.get(instance_type)
+        if results is not None and cls in results:
+            cached = results[cls]
+            if isinstance(cached, bool):
+                return cached
+            return all(hasattr(instance, attr) for attr in cached)
+        if getattr(cls, "_is_protocol", False) and getattr(
+            cls, "_is_runtime_protocol", False
+        ):
+            members = {
+                attr: getattr(instance_type, attr, None)
+                for attr in _PROTOCOL_ATTRS[cls]
+            }
+            if all(member is not None for member in members.values()):
+                slots = tuple(
+                    attr
+                    for attr, member in members.items()
+                    if isinstance(member, MemberDescriptorType)
+                )
+                _INSTANCECHECK_CACHE.setdefault(instance_type, {})[cls] = slots or True
+                return all(hasattr(instance, attr) for attr in slots)
+        result = super().__instancecheck__(instance)
+        if not hasattr(instance, "__dict__") and not hasattr(
+            instance_type, "__getattr__"
+        ):
+            _INSTANCECHECK_CACHE.setdefault(instance_type, {})[cls] = result
+        return result
+
+    def register(cls, subclass: type[_T]) -> type[_T]:
+        # Registering virtual subclasses may change cached results.
+        _INSTANCECHECK_CACHE.clear()
+        return super().register(subclass)
 
 
 @runtime_checkable
-class Seismogram(Protocol):
+class Seismogram(Protocol, metaclass=_PysmoProtocolMeta):
     """The `Seismogram` class defines a type for a basic seismogram as used in pysmo.
 
     Attributes:
@@ -28,32 +116,18 @@ class Seismogram(Protocol):
         '2005-03-02T07:23:02.160000'
     """
 
-    def __len__(self) -> int: ...
+    data: npt.NDArray
+    delta: float
+    begin_time: datetime.datetime
 
-    @property
-    def data(self) -> npt.NDArray: ...
-
-    @data.setter
-    def data(self, value: npt.NDArray) -> None: ...
-
-    @property
-    def begin_time(self) -> datetime.datetime: ...
-
-    @begin_time.setter
-    def begin_time(self, value: datetime.datetime) -> None: ...
+    def __len__(self) -> int: ...
 
     @property
     def end_time(self) -> datetime.datetime: ...
 
-    @property
-    def delta(self) -> float: ...
-
-    @delta.setter
-    def delta(self, value: float) -> None: ...
-
 
 @runtime_checkable
-class Location(Protocol):
+class Location(Protocol, metaclass=_PysmoProtocolMeta):
     """The `Location` defines surface coordinates in pysmo.
 
     Attributes:
@@ -61,17 +135,8 @@ class Location(Protocol):
         longitude: Longitude in degrees.
     """
 
-    @property
-    def latitude(self) -> float: ...
-
-    @latitude.setter
-    def latitude(self, value: float) -> None: ...
-
-    @property
-    def longitude(self) -> float: ...
-
-    @longitude.setter
-    def longitude(self, value: float) -> None: ...
+    latitude: float
+    longitude: float
 
 
 @runtime_checkable
@@ -86,12 +151,10 @@ class Station(Location, Protocol):
         elevation: Station elevation in metres.
     """
 
-    @property
-    def name(self) -> str: ...
-
-    @name.setter
-    def name(self, value: str) -> None: ...
+    name: str
 
+    # The setters of these properties don't accept None, so they can't be
+    # declared as plain attributes.
     @property
     def network(self) -> str | None: ...
 
@@ -115,11 +178,7 @@ class Hypocenter(Location, Protocol):
         longitude (float): Longitude in degrees.
     """
 
-    @property
-    def depth(self) -> float: ...
-
-    @depth.setter
-    def depth(self, value: float) -> None: ...
+    depth: float
 
 
 @runtime_checkable
@@ -133,8 +192,4 @@ class Event(Hypocenter, Protocol):
         time: Event origin time.
     """
 
-    @property
-    def time(self) -> datetime.datetime: ...
-
-    @time.setter
-    def time(self, value: datetime.datetime) -> None: ...
+    time: datetime.datetime
@@ -64,3 +64,21 @@ class TestMiniEvent:
             minievent.longitude = -180
         with pytest.raises(ValueError):
             minievent.latitude = 181
+
+    @pytest.mark.depends(name="test_create_instance")
+    def test_unchecked(self) -> None:
+        """Test creating an instance without validation."""
+
+        time = datetime.now(timezone.utc)
+        minievent = MiniEvent._unchecked(
+            latitude=1.1, longitude=2.2, depth=1000, time=time
+        )
+        assert isinstance(minievent, Event)
+        assert minievent == MiniEvent(
+            latitude=1.1, longitude=2.2, depth=1000, time=time
+        )
+        # setting attributes is still validated
+        with pytest.raises(ValueError):
+            minievent.latitude = 100
+        with pytest.raises(TypeError):
+            MiniEvent._unchecked(latitude=1.1, longitude=2.2, depth=1000)
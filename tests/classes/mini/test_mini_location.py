@@ -1,4 +1,6 @@
 import pytest
+import numpy as np
+from attrs import define, field
 from pysmo import MiniLocation, Location
 
 
@@ -37,3 +39,57 @@ class TestMiniLocation:
             minilocation.longitude = -180
         with pytest.raises(ValueError):
             minilocation.longitude = 181
+
+    @pytest.mark.depends(name="test_create_instance")
+    def test_from_arrays(self) -> None:
+        """Test creating multiple instances from arrays."""
+
+        latitudes, longitudes = np.array([1.1, -90, 90]), np.array([2.2, 180, -179.9])
+        minilocations = MiniLocation.from_arrays(
+            latitude=latitudes, longitude=longitudes
+        )
+        assert len(minilocations) == 3
+        for minilocation, latitude, longitude in zip(
+            minilocations, latitudes, longitudes
+        ):
+            assert isinstance(minilocation, Location)
+            assert minilocation == MiniLocation(latitude=latitude, longitude=longitude)
+            assert type(minilocation.latitude) is float
+        with pytest.raises(ValueError):
+            MiniLocation.from_arrays(latitude=[1.1, 91], longitude=[2.2, 2.2])
+        with pytest.raises(ValueError):
+            MiniLocation.from_arrays(latitude=[1.1, 1.1], longitude=[2.2, -180])
+        with pytest.raises(ValueError):
+            MiniLocation.from_arrays(latitude=[1.1], longitude=[2.2, 2.2])
+        with pytest.raises(ValueError):
+            MiniLocation.from_arrays(
+                latitude=np.array([1.0, np.nan, 80.0]), longitude=[1.0, 2.0, 3.0]
+            )
+        with pytest.raises(ValueError):
+            MiniLocation.from_arrays(
+                latitude=[1.0, 2.0, 3.0], longitude=np.array([1.0, 2.0, np.inf])
+            )
+        with pytest.raises(TypeError):
+            MiniLocation.from_arrays(latitude=[1.1])
+        with pytest.raises(TypeError):
+            MiniLocation.from_arrays(latitude=["a"], longitude=[2.2])
+        with pytest.raises(TypeError):
+            MiniLocation.from_arrays(latitude=[1.1], longitude=[2.2], depth=[1])
+
+    @pytest.mark.depends(name="test_from_arrays")
+    def test_from_arrays_values(self) -> None:
+        """Test values in sequences are used as they are, and defaults are set."""
+
+        minilocations = MiniLocation.from_arrays(latitude=[1.1, 2], longitude=[3, 4.4])
+        for minilocation, latitude, longitude in zip(minilocations, (1.1, 2), (3, 4.4)):
+            assert minilocation == MiniLocation(latitude=latitude, longitude=longitude)
+            assert type(minilocation.latitude) is type(latitude)
+            assert type(minilocation.longitude) is type(longitude)
+
+        @define(kw_only=True)
+        class TaggedLocation(MiniLocation):
+            tags: list[str] = field(factory=list)
+
+        tagged = TaggedLocation.from_arrays(latitude=[1.1, 2.2], longitude=[3.3, 4.4])
+        assert tagged[0].tags == tagged[1].tags == []
+        assert tagged[0].tags is not tagged[1].tags
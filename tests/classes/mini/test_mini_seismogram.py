@@ -1,6 +1,7 @@
 import numpy as np
 import numpy.testing as npt
 import pytest
+import attrs
 from datetime import datetime, timedelta, timezone
 from pysmo import Seismogram, MiniSeismogram, SAC
 from pysmo.lib.defaults import SEISMOGRAM_DEFAULTS
@@ -34,6 +35,9 @@ class TestMiniSeismogram:
         assert miniseis.delta == SEISMOGRAM_DEFAULTS.delta == 1
         assert miniseis.data.size == 0
         assert len(miniseis) == 0
+        # the default (empty) data are shared and can't be changed in place
+        assert miniseis.data is MiniSeismogram().data
+        assert not miniseis.data.flags.writeable
 
     @pytest.mark.depends(name="test_create_instance")
     def test_change_attributes(self) -> None:
@@ -61,6 +65,34 @@ class TestMiniSeismogram:
         with pytest.raises(TypeError):
             miniseis.begin_time = new_time_no_tz
 
+    @pytest.mark.depends(name="test_change_attributes")
+    def test_end_time_follows_attributes(self) -> None:
+        """Test end_time is updated when the attributes it depends on change."""
+
+        miniseis = MiniSeismogram(data=np.random.rand(11))
+        assert miniseis.end_time == miniseis.begin_time + timedelta(seconds=10)
+        miniseis.data = np.random.rand(21)
+        assert miniseis.end_time == miniseis.begin_time + timedelta(seconds=20)
+        miniseis.delta = 0.5
+        assert miniseis.end_time == miniseis.begin_time + timedelta(seconds=10)
+        miniseis.begin_time = datetime(2011, 11, 4, tzinfo=timezone.utc)
+        assert miniseis.end_time == miniseis.begin_time + timedelta(seconds=10)
+        miniseis.resample(1)
+        assert len(miniseis) == 10
+        assert miniseis.end_time == miniseis.begin_time + timedelta(seconds=9)
+        miniseis.data = np.array([])
+        assert miniseis.end_time == miniseis.begin_time
+
+    @pytest.mark.depends(name="test_create_instance")
+    def test_asdict_round_trip(self) -> None:
+        """Test a MiniSeismogram can be recreated from its attributes."""
+
+        miniseis = MiniSeismogram(data=np.random.rand(11))
+        new = MiniSeismogram(**attrs.asdict(miniseis, recurse=False))
+        assert new.begin_time == miniseis.begin_time
+        assert new.delta == miniseis.delta
+        npt.assert_array_equal(new.data, miniseis.data)
+
     @pytest.mark.depends(name="test_change_attributes")
     def test_as_seismogram(self) -> None:
         """check if it works in a functionfor Seismogram types."""
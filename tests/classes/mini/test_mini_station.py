@@ -1,4 +1,6 @@
 import pytest
+import numpy as np
+from attrs_strict import AttributeTypeError
 from pysmo import Station, MiniStation
 
 
@@ -46,3 +48,20 @@ class TestMiniStation:
             ministation.longitude = -180
         with pytest.raises(ValueError):
             ministation.longitude = 181
+
+    @pytest.mark.depends(name="test_create_instance")
+    def test_from_arrays(self) -> None:
+        """Test creating multiple instances from arrays."""
+
+        ministations = MiniStation.from_arrays(
+            name=["station1", "station2"],
+            latitude=np.array([1.1, 3.3]),
+            longitude=np.array([2.2, 4.4]),
+            elevation=[None, 123],
+        )
+        assert ministations == [
+            MiniStation(name="station1", latitude=1.1, longitude=2.2),
+            MiniStation(name="station2", latitude=3.3, longitude=4.4, elevation=123),
+        ]
+        with pytest.raises(AttributeTypeError):
+            MiniStation.from_arrays(name=[1, 2], latitude=[1.1, 3.3], longitude=[2, 4])
@@ -111,6 +111,31 @@ class TestSAC:
             with pytest.raises((TypeError, AttributeTypeError)):
                 setattr(sacseis, item, None)
 
+    @pytest.mark.depends(on=["test_sac_seismogram"])
+    def test_sac_seismogram_end_time_cache(self, sacfile: str) -> None:
+        """end_time changes when SAC headers are changed directly."""
+        sac = SAC.from_file(sacfile)
+        end_time = sac.seismogram.end_time
+        sac.nzyear = end_time.year + 1
+        assert sac.seismogram.end_time.year == end_time.year + 1
+        sac.b += 10
+        assert sac.seismogram.end_time == end_time.replace(
+            year=end_time.year + 1
+        ) + timedelta(seconds=10)
+        sac.data = np.array([])
+        assert sac.seismogram.end_time == sac.seismogram.begin_time
+
+    @pytest.mark.depends(on=["test_create_instance_from_file"])
+    def test_sac_timestamps_reference_time(self, sacfile: str) -> None:
+        """Timestamps follow changes to the SAC reference time headers."""
+        sac = SAC.from_file(sacfile)
+        begin_time = sac.timestamps.b
+        assert begin_time is not None
+        sac.nzhour = begin_time.hour + 1
+        assert sac.timestamps.b == begin_time + timedelta(hours=1)
+        sac.nzyear = None
+        assert sac.timestamps.b == SEISMOGRAM_DEFAULTS.begin_time
+
     @pytest.mark.depends(on=["test_create_instance_from_file"])
     def test_sac_as_station(self, sacfile: str) -> None:
         sac = SAC.from_file(sacfile)
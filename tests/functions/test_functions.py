@@ -61,6 +61,21 @@ class TestSeismogramFunctions:
         assert num2date(times[0]) == seismogram.begin_time
         assert num2date(times[-1]) == seismogram.end_time
 
+    def test_datetime_array(self, seismogram: Seismogram) -> None:
+        """Get datetime64 times from Seismogram object and verify them."""
+        from pysmo import datetime_array, unix_time_array
+
+        times = datetime_array(seismogram)
+        assert len(times) == len(seismogram)
+        assert times.dtype == np.dtype("datetime64[us]")
+        assert times[0] == np.datetime64(seismogram.begin_time.replace(tzinfo=None))
+        assert abs(
+            times[-1] - np.datetime64(seismogram.end_time.replace(tzinfo=None))
+        ) <= np.timedelta64(1, "us")
+        np.testing.assert_allclose(
+            times.astype("int64") / 1e6, unix_time_array(seismogram), rtol=0, atol=1e-6
+        )
+
     def test_unix_time_array(self, seismogram: Seismogram) -> None:
         """Get times from Seismogram object and verify them."""
         from pysmo import unix_time_array
@@ -45,6 +45,22 @@ def test_write_to_file(empty_file: str) -> None:
     npt.assert_allclose(sac.data, random_data)
 
 
+@pytest.mark.depends(on=["test_write_to_file"])
+def test_read_large_file(empty_file: str) -> None:
+    """Large files are memory mapped, which should give identical results."""
+    random_data = np.random.rand(500000)
+    SacIO(b=21.1, data=random_data).write(empty_file)
+    sac = SacIO.from_file(empty_file)
+    assert pytest.approx(sac.b) == 21.1
+    npt.assert_allclose(sac.data, random_data.astype(np.float32))
+
+    # truncated files raise the same error as smaller files
+    with open(empty_file, "r+b") as file_handle:
+        file_handle.truncate(632 + 499999 * 4)
+    with pytest.raises(EOFError):
+        SacIO.from_file(empty_file)
+
+
 @pytest.mark.depends(on=["test_create_instance_from_file"])
 def test_read_headers(sacfile: str) -> None:
     """Read all SacIO headers from a test file."""
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from pysmo import MiniSeismogram
+
+
+@pytest.mark.parametrize("npts", (1000, 1009))
+def test_lib_resample(npts: int) -> None:
+    """Resampled data match the original signal, also for awkward lengths."""
+    from pysmo.lib.functions import lib_resample
+
+    delta = 0.01
+    times = np.arange(npts) * delta
+    seismogram = MiniSeismogram(data=np.sin(times), delta=delta)
+    resampled = lib_resample(seismogram, delta * 2)
+    assert len(resampled) == int(npts / 2)
+    # ignore the edges, where the data are affected by the periodic extension
+    expected = np.sin(np.arange(len(resampled)) * delta * 2)
+    np.testing.assert_allclose(resampled[50:-50], expected[50:-50], atol=1e-2)
+
+
+@pytest.mark.parametrize("npts", (1000, 1001, 3601))
+def test_lib_resample_matches_scipy(npts: int) -> None:
+    """Lengths without large prime factors are resampled without padding."""
+    import scipy.signal
+    from pysmo.lib.functions import lib_resample
+
+    data = np.random.rand(npts)
+    seismogram = MiniSeismogram(data=data, delta=0.01)
+    resampled = lib_resample(seismogram, 0.02)
+    np.testing.assert_allclose(resampled, scipy.signal.resample(data, int(npts / 2)))
+
+
+@pytest.mark.parametrize("dtype", (np.float64, np.float32, np.int64))
+def test_lib_detrend(dtype: type) -> None:
+    """Detrended data match scipy.signal.detrend."""
+    import scipy.signal
+    from pysmo.lib.functions import lib_detrend
+
+    data: np.ndarray = (np.random.rand(1000) * 100 + np.arange(1000) * 0.5).astype(
+        dtype
+    )
+    seismogram = MiniSeismogram(data=data)
+    detrended = lib_detrend(seismogram)
+    expected = scipy.signal.detrend(data)
+    assert detrended.dtype == expected.dtype
+    np.testing.assert_allclose(detrended, expected, atol=1e-3)
+    assert seismogram.data is data
+    np.testing.assert_array_equal(lib_detrend(MiniSeismogram(data=data[:1])), [0])
+
+
+@pytest.mark.parametrize("dtype", (np.float64, np.float32))
+@pytest.mark.parametrize("npts, num", ((1000, 500), (1001, 333), (999, 1998)))
+def test_fourier_resample(dtype: type, npts: int, num: int) -> None:
+    """Resampled data match scipy.signal.resample and keep their dtype."""
+    import scipy.signal
+    from pysmo.lib.functions import _fourier_resample
+
+    data: np.ndarray = np.random.rand(npts).astype(dtype)
+    resampled = _fourier_resample(data, num)
+    assert resampled.dtype == dtype
+    np.testing.assert_allclose(resampled, scipy.signal.resample(data, num))
+
+
+def test_lib_resample_same_delta() -> None:
+    """Resampling to the same sampling interval returns a copy of the data."""
+    from pysmo.lib.functions import lib_resample
+
+    seismogram = MiniSeismogram(data=np.random.rand(1009), delta=0.1)
+    resampled = lib_resample(seismogram, 0.1)
+    np.testing.assert_array_equal(resampled, seismogram.data)
+    assert resampled is not seismogram.data
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        np.array([5, 10], dtype=np.uint8),
+        np.array([-128, 5], dtype=np.int8),
+        np.array([-3.0, 2.0]),
+        np.array([1.0, 2.0], dtype=np.float32),
+    ),
+)
+def test_lib_normalize(data: np.ndarray) -> None:
+    """Data are normalised with their absolute maximum for all dtypes."""
+    from pysmo.lib.functions import lib_normalize
+
+    normalized = lib_normalize(MiniSeismogram(data=data))
+    np.testing.assert_allclose(normalized, data / np.max(np.abs(data.astype(float))))
+    assert np.max(np.abs(normalized)) == 1
@@ -0,0 +1,23 @@
+from attrs import define, field
+
+import pytest
+
+
+def test_validate_latitude_longitude() -> None:
+    from pysmo.lib.validators import validate_latitude, validate_longitude
+
+    @define
+    class A:
+        lat: float = field(default=0, validator=validate_latitude)
+        lon: float = field(default=0, validator=validate_longitude)
+
+    for lat in (-90, 0, 45.5, 90):
+        assert A(lat=lat).lat == lat
+    for lon in (-179.9, 0, 180):
+        assert A(lon=lon).lon == lon
+    for lat in (-90.1, 90.1, float("nan")):
+        with pytest.raises(ValueError):
+            A(lat=lat)
+    for lon in (-180, 180.1, float("nan")):
+        with pytest.raises(ValueError):
+            A(lon=lon)
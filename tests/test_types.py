@@ -0,0 +1,99 @@
+import gc
+from pysmo import Location, Seismogram, MiniLocation, MiniSeismogram
+from pysmo.types import _INSTANCECHECK_CACHE
+
+
+class InstanceLocation:
+    """Location compatible class with attributes set on the instance only."""
+
+    def __init__(self) -> None:
+        self.latitude = 1.0
+        self.longitude = 2.0
+
+
+class ClassLocation:
+    """Location compatible class with attributes set on the class."""
+
+    latitude = 1.0
+    longitude = 2.0
+
+
+class SlotsLocation:
+    """Location compatible class with attributes in slots."""
+
+    __slots__ = ("latitude", "longitude")
+
+
+def test_isinstance_cached_for_class_attributes() -> None:
+    """Checks are cached when all members are defined on the class."""
+    assert isinstance(ClassLocation(), Location)
+    assert _INSTANCECHECK_CACHE[ClassLocation][Location] is True
+    assert isinstance(ClassLocation(), Location)
+    assert isinstance(MiniSeismogram(), Seismogram)
+    assert isinstance(MiniSeismogram(), Seismogram)
+
+
+def test_isinstance_slots_checked_on_instance() -> None:
+    """Slots must be set on the instance."""
+    location = SlotsLocation()
+    assert not isinstance(location, Location)
+    location.latitude = 1.0
+    location.longitude = 2.0
+    assert isinstance(location, Location)
+    assert not isinstance(SlotsLocation(), Location)
+
+
+def test_isinstance_not_cached_for_instance_attributes() -> None:
+    """Checks depending on instance attributes are not cached."""
+    location = InstanceLocation()
+    assert isinstance(location, Location)
+    assert InstanceLocation not in _INSTANCECHECK_CACHE
+    del location.latitude
+    assert not isinstance(location, Location)
+
+
+def test_isinstance_false() -> None:
+    """Classes not matching a type are still recognised as such."""
+    assert not isinstance(MiniLocation(latitude=1, longitude=2), Seismogram)
+    assert not isinstance(object(), Location)
+
+
+def test_isinstance_cache_weak() -> None:
+    """Cached results do not keep classes alive."""
+
+    class TmpLocation:
+        latitude = 1.0
+        longitude = 2.0
+
+    assert isinstance(TmpLocation(), Location)
+    assert TmpLocation in _INSTANCECHECK_CACHE
+    size = len(_INSTANCECHECK_CACHE)
+    del TmpLocation
+    gc.collect()
+    assert len(_INSTANCECHECK_CACHE) == size - 1
+
+
+def test_isinstance_negative_cached() -> None:
+    """Negative results are cached for classes without instance attributes."""
+    assert not isinstance(MiniLocation(latitude=1, longitude=2), Seismogram)
+    assert _INSTANCECHECK_CACHE[MiniLocation][Seismogram] is False
+
+
+def test_isinstance_cache_register() -> None:
+    """Registering a virtual subclass is reflected in cached results."""
+
+    class SlotsClass:
+        __slots__ = ()
+
+    assert not isinstance(SlotsClass(), Location)
+    assert _INSTANCECHECK_CACHE[SlotsClass][Location] is False
+    Location.register(SlotsClass)
+    assert isinstance(SlotsClass(), Location)
+
+
+def test_type_hints() -> None:
+    """Annotations of pysmo types can be resolved at runtime."""
+    import typing
+
+    for protocol in (Seismogram, Location):
+        assert typing.get_type_hints(protocol)
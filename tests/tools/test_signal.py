@@ -1,5 +1,5 @@
 from tests.conftest import TESTDATA
-from pysmo.tools.signal import gauss, envelope, delay
+from pysmo.tools.signal import gauss, envelope, envelope_multi, delay
 from pysmo import Seismogram, plotseis, SAC, MiniSeismogram, detrend
 import matplotlib.figure
 import pytest
@@ -47,6 +47,41 @@ def test_gauss(seismogram: Seismogram) -> None:
     assert pytest.approx(gauss_seis.data[100]) == -5.639860165811819
 
 
+def test_gauss_float32() -> None:
+    """
+    Gaussian filtering of single precision data should return single precision
+    data that is close to the double precision result.
+    """
+    Tn = 50
+    alpha = 50
+    seismogram32 = MiniSeismogram.clone(MINISEIS, skip_data=True)
+    seismogram32.data = MINISEIS.data.astype(np.float32)
+    gauss_seis = gauss(seismogram32, Tn, alpha)
+    env_seis = envelope(seismogram32, Tn, alpha)
+    assert gauss_seis.data.dtype == np.float32
+    assert env_seis.data.dtype == np.float32
+    assert pytest.approx(gauss_seis.data[100], rel=1e-4) == -5.639860165811819
+    assert pytest.approx(env_seis.data[100], rel=1e-4) == 6.109130497913114
+
+
+@pytest_cases.parametrize(
+    "seismogram", (SACSEIS, MINISEIS), ids=("SacSeismogram", "MiniSeismogram")
+)
+def test_envelope_multi(seismogram: Seismogram) -> None:
+    """
+    Calculate gaussian envelopes for multiple center periods and verify they
+    match the envelopes calculated individually.
+    """
+    Tns = (20, 50, 100)
+    alpha = 50
+    env_seismograms = envelope_multi(seismogram, Tns, alpha)
+    assert len(env_seismograms) == len(Tns)
+    for Tn, env_seis in zip(Tns, env_seismograms):
+        np.testing.assert_allclose(env_seis.data, envelope(seismogram, Tn, alpha).data)
+        assert env_seis.begin_time == seismogram.begin_time
+        assert env_seis.delta == seismogram.delta
+
+
 @pytest.mark.depends(on=["test_envelope", "test_gauss"])
 @pytest.mark.mpl_image_compare(remove_text=True, baseline_dir="../baseline/")
 def test_plot_gauss_env(seismogram: Seismogram = SACSEIS) -> matplotlib.figure.Figure:
@@ -28,10 +28,10 @@ properties = [
 ]
 
 validators = dict(
-    stla="validators.optional([type_validator(), validators.ge(-90), validators.le(90)])",  # noqa: E501
-    stlo="validators.optional([type_validator(), validators.gt(-180), validators.le(180)])",  # noqa: E501
-    evla="validators.optional([type_validator(), validators.ge(-90), validators.le(90)])",  # noqa: E501
-    evlo="validators.optional([type_validator(), validators.gt(-180), validators.le(180)])",  # noqa: E501
+    stla="validators.optional([type_validator(), validate_latitude])",
+    stlo="validators.optional([type_validator(), validate_longitude])",
+    evla="validators.optional([type_validator(), validate_latitude])",
+    evlo="validators.optional([type_validator(), validate_longitude])",
 )
 
 # Read yaml file with dictionaries describing SAC headers